@@ -3,79 +3,158 @@
 
 from __future__ import annotations
 
+import argparse
 import csv
+import re
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
+from typing import NoReturn
 
 
-@dataclass
+# Category codes are interned once so equality checks can short-circuit on identity.
+_FA = sys.intern("FA")
+_SA = sys.intern("SA")
+_CATEGORIES = {_FA: _FA, _SA: _SA}
+
+
+@dataclass(frozen=True)
 class Assignment:
+    # Declared by hand: dataclass(slots=True) would require Python 3.10.
+    __slots__ = ("name", "category", "grade", "weight")
+
     name: str
     category: str  # "FA" or "SA"
     grade: float   # 0-100
     weight: float  # >0
 
-    @property
-    def weighted_score(self) -> float:
-        return (self.grade / 100) * self.weight
 
+# Plain decimal numbers only; rejects "nan", "inf" and exponents before float().
+_is_number = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)").fullmatch
+
+_ROW_FMT = "%d. %s [%s] Grade: %.2f | Weight: %.2f | Weighted: %.2f"
+
+_row_fields = attrgetter("name", "category", "grade", "weight")
+
+csv.register_dialect("grades", delimiter=",", quoting=csv.QUOTE_MINIMAL, lineterminator="\r\n")
+
+# Names without these characters can be written without csv quoting.
+_CSV_SPECIAL = frozenset(',"\r\n')
+_CSV_ROW_FMT = "%s,%s,%.2f,%.2f\r\n"
+
+
+class _AnswerFile:
+    """Serve pre-read answer lines in place of ``input``; any invalid answer is fatal."""
 
-def prompt_non_empty(prompt: str) -> str:
+    def __init__(self, lines: list[str]) -> None:
+        self._lines = iter(lines)
+        self.line_no = 0
+
+    def read(self, prompt: str) -> str:
+        try:
+            line = next(self._lines)
+        except StopIteration:
+            raise EOFError from None
+        self.line_no += 1
+        return line
+
+    def fail(self, message: str) -> NoReturn:
+        # Nobody can retry a file, so stop instead of reading the next line as a retry.
+        sys.exit(f"line {self.line_no}: {message}")
+
+
+def prompt_non_empty(
+    prompt: str,
+    read: Callable[[str], str] = input,
+    report: Callable[[str], None] = print,
+) -> str:
     while True:
-        value = input(prompt).strip()
+        value = read(prompt).strip()
         if value:
             return value
-        print("Value cannot be empty. Please try again.")
+        report("Value cannot be empty. Please try again.")
 
 
-def prompt_category() -> str:
+def prompt_category(
+    read: Callable[[str], str] = input,
+    report: Callable[[str], None] = print,
+) -> str:
     while True:
-        category = input('Category ("FA" or "SA"): ').strip().upper()
-        if category in {"FA", "SA"}:
+        category = _CATEGORIES.get(read('Category ("FA" or "SA"): ').strip().upper())
+        if category is not None:
             return category
-        print('Invalid category. Please enter "FA" or "SA".')
+        report('Invalid category. Please enter "FA" or "SA".')
 
 
-def prompt_float(
+def make_float_prompter(
     prompt: str,
     min_value: float | None = None,
     max_value: float | None = None,
     strict_greater: bool = False,
-) -> float:
-    while True:
-        raw = input(prompt).strip()
-        try:
+) -> Callable[[Callable[[str], str], Callable[[str], None]], float]:
+    """Return a float prompt with its bounds checks and error messages prebuilt."""
+    # Each check is (fails(value), message).
+    checks: list[tuple[Callable[[float], bool], str]] = []
+    if min_value is not None:
+        if strict_greater:
+            checks.append((lambda v: v <= min_value, f"Value must be greater than {min_value}."))
+        else:
+            checks.append((lambda v: v < min_value, f"Value must be at least {min_value}."))
+    if max_value is not None:
+        checks.append((lambda v: v > max_value, f"Value must be at most {max_value}."))
+
+    def prompt_float(read: Callable[[str], str], report: Callable[[str], None]) -> float:
+        while True:
+            raw = read(prompt).strip()
+            if not _is_number(raw):
+                report("Please enter a numeric value.")
+                continue
             value = float(raw)
-        except ValueError:
-            print("Please enter a numeric value.")
-            continue
 
-        if min_value is not None:
-            if strict_greater and value <= min_value:
-                print(f"Value must be greater than {min_value}.")
-                continue
-            if not strict_greater and value < min_value:
-                print(f"Value must be at least {min_value}.")
-                continue
-        if max_value is not None and value > max_value:
-            print(f"Value must be at most {max_value}.")
-            continue
-        return value
+            for fails, message in checks:
+                if fails(value):
+                    report(message)
+                    break
+            else:
+                return value
+
+    return prompt_float
+
+
+prompt_grade = make_float_prompter("Grade (0-100): ", min_value=0, max_value=100)
+prompt_weight = make_float_prompter("Weight (positive number): ", min_value=0, strict_greater=True)
 
 
-def collect_assignments() -> list[Assignment]:
+def collect_assignments(batch: bool = False) -> list[Assignment]:
     assignments: list[Assignment] = []
-    print("Enter assignments. When finished, type 'n' when asked to add another.")
+    if batch:
+        # Answers come from stdin: read everything up front and skip the prompts.
+        # Iterating the stream splits on newlines only, exactly as input() does.
+        answers = _AnswerFile([line.rstrip("\n") for line in sys.stdin])
+        read, report = answers.read, answers.fail
+    else:
+        read, report = input, print
+        print("Enter assignments. When finished, type 'n' when asked to add another.")
 
     while True:
-        name = prompt_non_empty("Assignment name: ")
-        category = prompt_category()
-        grade = prompt_float("Grade (0-100): ", min_value=0, max_value=100)
-        weight = prompt_float("Weight (positive number): ", min_value=0, strict_greater=True)
+        # End of input between assignments means the user is done.
+        try:
+            name = prompt_non_empty("Assignment name: ", read, report)
+        except EOFError:
+            break
+        category = prompt_category(read, report)
+        grade = prompt_grade(read, report)
+        weight = prompt_weight(read, report)
 
         assignments.append(Assignment(name=name, category=category, grade=grade, weight=weight))
 
-        again = input("Add another assignment? (y/n): ").strip().lower()
+        try:
+            again = read("Add another assignment? (y/n): ").strip().lower()
+        except EOFError:
+            break
         if again not in {"y", "yes", ""}:
             break
 
@@ -83,10 +162,19 @@ def collect_assignments() -> list[Assignment]:
 
 
 def summarize(assignments: list[Assignment]) -> None:
-    fa_weight = sum(a.weight for a in assignments if a.category == "FA")
-    sa_weight = sum(a.weight for a in assignments if a.category == "SA")
-    fa_total = sum(a.weighted_score for a in assignments if a.category == "FA")
-    sa_total = sum(a.weighted_score for a in assignments if a.category == "SA")
+    # Single pass: tally both categories and keep the FA rows for the resubmission check.
+    # The per-row (grade / 100) * weight form keeps totals rounding exactly as before.
+    fa: list[Assignment] = []
+    fa_weight = sa_weight = fa_total = sa_total = 0.0
+    for a in assignments:
+        ws = (a.grade / 100) * a.weight
+        if a.category == _FA:
+            fa.append(a)
+            fa_weight += a.weight
+            fa_total += ws
+        elif a.category == _SA:
+            sa_weight += a.weight
+            sa_total += ws
 
     final_grade = fa_total + sa_total
     gpa = (final_grade / 100) * 5
@@ -96,33 +184,49 @@ def summarize(assignments: list[Assignment]) -> None:
     passed = fa_pass and sa_pass
 
     print("\n--- Grade Summary ---")
-    for idx, a in enumerate(assignments, start=1):
-        print(
-            f"{idx}. {a.name} [{a.category}] "
-            f"Grade: {a.grade:.2f} | Weight: {a.weight:.2f} | Weighted: {a.weighted_score:.2f}"
+    lines = [
+        _ROW_FMT % (idx, name, category, grade, weight, (grade / 100) * weight)
+        for idx, (name, category, grade, weight) in enumerate(
+            map(_row_fields, assignments), start=1
         )
+    ]
+    print("\n".join(lines))
 
     print(f"\nFA total: {fa_total:.2f} / {fa_weight:.2f}")
     print(f"SA total: {sa_total:.2f} / {sa_weight:.2f}")
     print(f"Final grade: {final_grade:.2f}")
     print(f"GPA (5-point scale): {gpa:.2f}")
     print(f"Pass status: {'PASS' if passed else 'FAIL'}")
-    print(resubmission_message(assignments))
+    print(resubmission_message(fa))
 
 
-def resubmission_message(assignments: list[Assignment]) -> str:
-    """Return a short resubmission note based on failed formative assignments."""
-    failing_fa = [a for a in assignments if a.category == "FA" and a.grade < 50]
-    if not failing_fa:
+def resubmission_message(fa_assignments: list[Assignment]) -> str:
+    """Return a short resubmission note based on failed formative assignments.
+
+    ``fa_assignments`` must already be filtered to the FA category.
+    """
+    # One pass: count failures and keep the highest-weight ones seen so far.
+    failed = 0
+    max_weight = 0.0
+    top_failures: list[Assignment] = []
+    for a in fa_assignments:
+        if a.grade >= 50:
+            continue
+        failed += 1
+        if not top_failures or a.weight > max_weight:
+            max_weight = a.weight
+            top_failures = [a]
+        elif a.weight == max_weight:
+            top_failures.append(a)
+
+    if not failed:
         return "Resubmission: no failed formative assignments."
 
-    if len(failing_fa) == 1:
-        a = failing_fa[0]
+    if failed == 1:
+        a = top_failures[0]
         return f"Resubmission: {a.name} (FA) is eligible to resubmit."
 
     # Multiple failed FAs: pick the one with the highest weight, or list ties.
-    max_weight = max(a.weight for a in failing_fa)
-    top_failures = [a for a in failing_fa if a.weight == max_weight]
     if len(top_failures) == 1:
         a = top_failures[0]
         return f"Resubmission: choose {a.name} (highest-weight failed FA)."
@@ -132,23 +236,40 @@ def resubmission_message(assignments: list[Assignment]) -> str:
 
 
 def write_csv(assignments: list[Assignment], path: Path) -> None:
-    with path.open("w", newline="") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["Assignment", "Category", "Grade", "Weight"])
+    with path.open("w", newline="", buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile, dialect="grades")
+        writer.writerow(("Assignment", "Category", "Grade", "Weight"))
+        write = csvfile.write
         for a in assignments:
-            writer.writerow([a.name, a.category, f"{a.grade:.2f}", f"{a.weight:.2f}"])
+            if _CSV_SPECIAL.isdisjoint(a.name):
+                write(_CSV_ROW_FMT % (a.name, a.category, a.grade, a.weight))
+            else:
+                writer.writerow((a.name, a.category, "%.2f" % a.grade, "%.2f" % a.weight))
 
 
 def main() -> None:
-    assignments = collect_assignments()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="read answers from stdin without prompting (e.g. < answers.txt)",
+    )
+    args = parser.parse_args()
+
+    try:
+        assignments = collect_assignments(batch=args.batch)
+    except EOFError:
+        sys.exit("\nInput ended in the middle of an assignment. Exiting.")
     if not assignments:
         print("No assignments were entered. Exiting.")
         return
 
-    summarize(assignments)
-
     csv_path = Path("grades.csv")
-    write_csv(assignments, csv_path)
+    # Write the CSV in the background while the summary is printed.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        saved = executor.submit(write_csv, assignments, csv_path)
+        summarize(assignments)
+        saved.result()  # re-raises any error from the writer thread
     print(f"\nSaved CSV to {csv_path.resolve()}")
 
 